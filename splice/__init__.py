@@ -15,6 +15,8 @@ from .connections import FlyingLead
 from .components import PinRef, CoreRef
 from .validation import ValidationResult
 from .labels import BundleLabel, LabelSettings
+from .notes import DesignNote
+from .utils import DuplicateDesignatorError
 
 # Enums for type safety
 from .enums import (
@@ -42,6 +44,8 @@ __all__ = [
     "ValidationResult",
     "BundleLabel",
     "LabelSettings",
+    "DesignNote",
+    "DuplicateDesignatorError",
     # Enums
     "WireColor",
     "ConductorType",
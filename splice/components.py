@@ -11,6 +11,8 @@ from .enums import ConnectorCategory, ConnectorGender, ConnectorShape, WireColor
 class PinRef:
     """Reference to a specific pin on a component."""
 
+    __slots__ = ("component", "pin", "__weakref__")
+
     def __init__(self, component: "ComponentInstance", pin: int) -> None:
         self.component = component
         self.pin = pin
@@ -22,6 +24,8 @@ class PinRef:
 class CoreRef:
     """Reference to a specific core on a cable component."""
 
+    __slots__ = ("component", "core", "__weakref__")
+
     def __init__(self, component: "CableInstance", core: int) -> None:
         self.component = component
         self.core = core
@@ -44,6 +48,17 @@ class ComponentInstance:
         custom_fields: Additional component-specific fields
     """
 
+    __slots__ = (
+        "kind",
+        "designator",
+        "mpn",
+        "manufacturer",
+        "position",
+        "category",
+        "custom_fields",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         kind: ComponentType,
@@ -114,6 +129,8 @@ class ConnectorInstance(ComponentInstance):
         **kwargs: Additional component-specific fields
     """
 
+    __slots__ = ("positions", "gender", "shape")
+
     def __init__(
         self,
         designator: str,
@@ -163,6 +180,8 @@ class CableInstance(ComponentInstance):
     Cables have multiple cores that can be individually connected.
     """
 
+    __slots__ = ("cores",)
+
     def __init__(
         self,
         designator: str,
@@ -217,6 +236,8 @@ class WireInstance(ComponentInstance):
         **kwargs: Additional component-specific fields
     """
 
+    __slots__ = ("awg", "color")
+
     def __init__(
         self,
         designator: str,
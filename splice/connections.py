@@ -22,6 +22,14 @@ class FlyingLead:
         label: Optional label for the flying lead
     """
 
+    __slots__ = (
+        "termination_type",
+        "strip_length_mm",
+        "tin_length_mm",
+        "label",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         termination_type: Union[FlyingLeadType, str] = FlyingLeadType.BARE,
@@ -75,6 +83,17 @@ class Connection:
         label_end2: Optional label for end2
     """
 
+    __slots__ = (
+        "end1",
+        "end2",
+        "wire",
+        "length_mm",
+        "label",
+        "label_end1",
+        "label_end2",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         end1: ConnectionEnd,
@@ -3,7 +3,7 @@ Export harness to Splice-compatible JSON format.
 """
 
 import uuid
-from typing import Dict, Any, List, TYPE_CHECKING
+from typing import Callable, Dict, Any, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .harness import Harness
@@ -14,12 +14,86 @@ from .components import ConnectorInstance, CableInstance, WireInstance, PinRef,
 from .connections import FlyingLead
 from .types import ComponentType
 
+# BOM units: wire length is measured in feet, everything else is counted
+WIRE_UNIT = "ft"
+EACH_UNIT = "each"
+
 
 def generate_wire_key(index: int) -> str:
     """Generate a wire key for a connection."""
     return f"W{index}"
 
 
+def _connector_spec(component: "ConnectorInstance", part_id: str) -> Dict[str, Any]:
+    """Build the part spec for a connector."""
+    spec: Dict[str, Any] = {
+        "positions": component.positions,
+        "part_id": part_id,
+    }
+
+    # Add category-specific fields if present
+    if component.category:
+        spec["category"] = component.category
+
+    # Add any custom fields to the spec
+    for key, value in component.custom_fields.items():
+        if key not in ["positions", "kind", "designator"]:
+            spec[key] = value
+
+    return spec
+
+
+def _cable_spec(component: "CableInstance", part_id: str) -> Dict[str, Any]:
+    """Build the part spec for a cable."""
+    cores_spec = []
+    for core in component.cores:
+        cores_spec.append({
+            "core_no": core.number,
+            "awg": core.awg if hasattr(core, 'awg') else None,
+            "core_color": core.color if hasattr(core, 'color') else None,
+            "conductor_type": "stranded",  # Default
+        })
+
+    return {
+        "core_count": len(component.cores),
+        "cores": cores_spec,
+        "part_id": part_id,
+        **component.custom_fields,
+    }
+
+
+def _wire_spec(component: "WireInstance", part_id: str) -> Dict[str, Any]:
+    """Build the part spec for a wire component."""
+    return {
+        "awg": component.awg,
+        "color": component.color,
+        "conductor_type": "stranded",  # Default
+        "part_id": part_id,
+        **{k: v for k, v in component.custom_fields.items() if k not in ["awg", "color"]},
+    }
+
+
+def _dispatch(
+    table: Dict[type, Callable[..., Dict[str, Any]]], obj: Any
+) -> Optional[Callable[..., Dict[str, Any]]]:
+    """Look up the handler for obj's class, falling back to its base classes."""
+    handler = table.get(type(obj))
+    if handler is None:
+        for base in type(obj).__mro__[1:]:
+            handler = table.get(base)
+            if handler is not None:
+                break
+    return handler
+
+
+# Part spec builders keyed by component class
+_SPEC_BUILDERS: Dict[type, Callable[[Any, str], Dict[str, Any]]] = {
+    ConnectorInstance: _connector_spec,
+    CableInstance: _cable_spec,
+    WireInstance: _wire_spec,
+}
+
+
 def component_to_bom_item(component: "ComponentInstance") -> Dict[str, Any]:
     """
     Convert a component to a BOM item with part specification.
@@ -39,52 +113,13 @@ def component_to_bom_item(component: "ComponentInstance") -> Dict[str, Any]:
     }
 
     # Add spec based on component type
-    if isinstance(component, ConnectorInstance):
-        spec: Dict[str, Any] = {
-            "positions": component.positions,
-            "part_id": part["id"],
-        }
-
-        # Add category-specific fields if present
-        if component.category:
-            spec["category"] = component.category
-
-        # Add any custom fields to the spec
-        for key, value in component.custom_fields.items():
-            if key not in ["positions", "kind", "designator"]:
-                spec[key] = value
-
-        part["spec"] = spec
-
-    elif isinstance(component, CableInstance):
-        cores_spec = []
-        for core in component.cores:
-            cores_spec.append({
-                "core_no": core.number,
-                "awg": core.awg if hasattr(core, 'awg') else None,
-                "core_color": core.color if hasattr(core, 'color') else None,
-                "conductor_type": "stranded",  # Default
-            })
-
-        part["spec"] = {
-            "core_count": len(component.cores),
-            "cores": cores_spec,
-            "part_id": part["id"],
-            **component.custom_fields,
-        }
-
-    elif isinstance(component, WireInstance):
-        part["spec"] = {
-            "awg": component.awg,
-            "color": component.color,
-            "conductor_type": "stranded",  # Default
-            "part_id": part["id"],
-            **{k: v for k, v in component.custom_fields.items() if k not in ["awg", "color"]},
-        }
+    build_spec = _dispatch(_SPEC_BUILDERS, component)
+    if build_spec is not None:
+        part["spec"] = build_spec(component, part["id"])
 
     # Build the BOM item
-    # Wires use "ft" (feet), connectors and cables use "each"
-    unit = "ft" if component.kind == ComponentType.WIRE else "each"
+    # Wires use feet, connectors and cables are counted
+    unit = WIRE_UNIT if component.kind is ComponentType.WIRE else EACH_UNIT
 
     bom_item = {
         "instance_id": component.designator,
@@ -130,10 +165,56 @@ def wire_to_bom_item(wire_key: str, connection: "Connection") -> Dict[str, Any]:
     return {
         "instance_id": wire_key,
         "part": part,
-        "unit": "ft",  # Wire length measured in feet
+        "unit": WIRE_UNIT,
     }
 
 
+def _pin_end(end: PinRef) -> Dict[str, Any]:
+    """Convert a connector pin endpoint to mapping format."""
+    return {
+        "type": "connector_pin",
+        "connector_instance": end.component.designator,
+        "pin": end.pin,
+        "side": "left",  # Default side
+        "terminal_instance": None,
+    }
+
+
+def _core_end(end: CoreRef) -> Dict[str, Any]:
+    """Convert a cable core endpoint to mapping format."""
+    return {
+        "type": "cable_core",
+        "cable_instance": end.component.designator,
+        "core_no": end.core,
+        "side": "left",  # Default side
+    }
+
+
+def _flying_lead_end(end: FlyingLead) -> Dict[str, Any]:
+    """Convert a flying lead endpoint to mapping format."""
+    data: Dict[str, Any] = {
+        "type": "flying_lead",
+        "termination_type": end.termination_type,
+    }
+    if end.strip_length_mm:
+        data["strip_length_mm"] = end.strip_length_mm
+    return data
+
+
+# Mapping endpoint converters keyed by endpoint class
+_END_EMITTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    PinRef: _pin_end,
+    CoreRef: _core_end,
+    FlyingLead: _flying_lead_end,
+}
+
+# Converters for the far end of a cable core connection (cores never chain)
+_CORE_PEER_EMITTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    PinRef: _pin_end,
+    FlyingLead: _flying_lead_end,
+}
+
+
 def connection_to_mapping_entry(connection: "Connection") -> Dict[str, Any]:
     """
     Convert a connection to a mapping entry.
@@ -146,53 +227,13 @@ def connection_to_mapping_entry(connection: "Connection") -> Dict[str, Any]:
     """
     mapping_entry: Dict[str, Any] = {}
 
-    # Convert end1
-    if isinstance(connection.end1, PinRef):
-        mapping_entry["end1"] = {
-            "type": "connector_pin",
-            "connector_instance": connection.end1.component.designator,
-            "pin": connection.end1.pin,
-            "side": "left",  # Default side
-            "terminal_instance": None,
-        }
-    elif isinstance(connection.end1, CoreRef):
-        mapping_entry["end1"] = {
-            "type": "cable_core",
-            "cable_instance": connection.end1.component.designator,
-            "core_no": connection.end1.core,
-            "side": "left",  # Default side
-        }
-    elif isinstance(connection.end1, FlyingLead):
-        mapping_entry["end1"] = {
-            "type": "flying_lead",
-            "termination_type": connection.end1.termination_type,
-        }
-        if connection.end1.strip_length_mm:
-            mapping_entry["end1"]["strip_length_mm"] = connection.end1.strip_length_mm
-
-    # Convert end2
-    if isinstance(connection.end2, PinRef):
-        mapping_entry["end2"] = {
-            "type": "connector_pin",
-            "connector_instance": connection.end2.component.designator,
-            "pin": connection.end2.pin,
-            "side": "left",  # Default side for end2
-            "terminal_instance": None,
-        }
-    elif isinstance(connection.end2, CoreRef):
-        mapping_entry["end2"] = {
-            "type": "cable_core",
-            "cable_instance": connection.end2.component.designator,
-            "core_no": connection.end2.core,
-            "side": "left",  # Default side for end2
-        }
-    elif isinstance(connection.end2, FlyingLead):
-        mapping_entry["end2"] = {
-            "type": "flying_lead",
-            "termination_type": connection.end2.termination_type,
-        }
-        if connection.end2.strip_length_mm:
-            mapping_entry["end2"]["strip_length_mm"] = connection.end2.strip_length_mm
+    # Convert end1 and end2
+    emit_end1 = _dispatch(_END_EMITTERS, connection.end1)
+    if emit_end1 is not None:
+        mapping_entry["end1"] = emit_end1(connection.end1)
+    emit_end2 = _dispatch(_END_EMITTERS, connection.end2)
+    if emit_end2 is not None:
+        mapping_entry["end2"] = emit_end2(connection.end2)
 
     # Add length if specified
     if connection.length_mm is not None:
@@ -217,7 +258,7 @@ def harness_to_splice_format(harness: "Harness") -> Dict[str, Any]:
     {
       "bom": {
         "X1": { "instance_id": "X1", "part": {...}, "unit": "each" },
-        "W1": { "instance_id": "W1", "part": {...}, "unit": "mm" }
+        "W1": { "instance_id": "W1", "part": {...}, "unit": "ft" }
       },
       "data": {
         "mapping": {
@@ -247,17 +288,16 @@ def harness_to_splice_format(harness: "Harness") -> Dict[str, Any]:
 
     # Convert components to BOM items
     for component in harness.components:
-        bom_item = component_to_bom_item(component)
-        bom[component.designator] = bom_item
+        designator = component.designator
+        bom[designator] = component_to_bom_item(component)
 
         # Add position data
-        if component.position:
-            position_data = {"x": component.position[0], "y": component.position[1]}
-
-            if component.kind == ComponentType.CABLE:
-                cable_positions[component.designator] = position_data
-            else:
-                connector_positions[component.designator] = position_data
+        position = component.position
+        if position:
+            positions = (
+                cable_positions if component.kind is ComponentType.CABLE else connector_positions
+            )
+            positions[designator] = {"x": position[0], "y": position[1]}
 
     # Convert connections to mapping entries
     # For cable cores, we need to merge two connections into one mapping entry
@@ -294,21 +334,9 @@ def harness_to_splice_format(harness: "Harness") -> Dict[str, Any]:
                 mapping_entry["end1"] = existing_data["connector_end"]
 
                 # Convert the other_end to mapping format
-                if isinstance(other_end, PinRef):
-                    mapping_entry["end2"] = {
-                        "type": "connector_pin",
-                        "connector_instance": other_end.component.designator,
-                        "pin": other_end.pin,
-                        "side": "left",
-                        "terminal_instance": None,
-                    }
-                elif isinstance(other_end, FlyingLead):
-                    mapping_entry["end2"] = {
-                        "type": "flying_lead",
-                        "termination_type": other_end.termination_type,
-                    }
-                    if other_end.strip_length_mm:
-                        mapping_entry["end2"]["strip_length_mm"] = other_end.strip_length_mm
+                emit_end = _dispatch(_CORE_PEER_EMITTERS, other_end)
+                if emit_end is not None:
+                    mapping_entry["end2"] = emit_end(other_end)
 
                 # Merge labels
                 if existing_data.get("label"):
@@ -325,29 +353,18 @@ def harness_to_splice_format(harness: "Harness") -> Dict[str, Any]:
                 del core_connections[wire_key]
             else:
                 # First connection to this core - store the connector end
-                connector_end_data = {}
+                connector_end_data: Dict[str, Any] = {}
                 label = None
 
+                emit_end = _dispatch(_CORE_PEER_EMITTERS, other_end)
+                if emit_end is not None:
+                    connector_end_data = emit_end(other_end)
+                # Get label from the non-core end (only tracked for connector pins)
                 if isinstance(other_end, PinRef):
-                    connector_end_data = {
-                        "type": "connector_pin",
-                        "connector_instance": other_end.component.designator,
-                        "pin": other_end.pin,
-                        "side": "left",
-                        "terminal_instance": None,
-                    }
-                    # Get label from the non-core end
-                    if isinstance(connection.end1, CoreRef):
+                    if core_ref is connection.end1:
                         label = connection.label_end2
                     else:
                         label = connection.label_end1
-                elif isinstance(other_end, FlyingLead):
-                    connector_end_data = {
-                        "type": "flying_lead",
-                        "termination_type": other_end.termination_type,
-                    }
-                    if other_end.strip_length_mm:
-                        connector_end_data["strip_length_mm"] = other_end.strip_length_mm
 
                 core_connections[wire_key] = {
                     "connector_end": connector_end_data,
@@ -378,35 +395,10 @@ def harness_to_splice_format(harness: "Harness") -> Dict[str, Any]:
 
     # Convert design notes
     for note in harness.notes:
-        design_note = {
-            "id": str(uuid.uuid4()),
-            "x": note["position"]["x"],
-            "y": note["position"]["y"],
-            "title": note.get("title", ""),
-            "content": note.get("content", []),
-        }
-        design_notes.append(design_note)
+        design_notes.append({"id": str(uuid.uuid4()), **note.to_dict()})
 
     # Convert labels
-    bundle_labels: Dict[str, Any] = {}
-    for label in harness.labels:
-        label_data: Dict[str, Any] = {
-            "id": label.id,
-            "label_text": label.label_text,
-            "is_auto_generated": label.is_auto_generated,
-            "width_mm": label.width_mm,
-            "font_size": label.font_size,
-            "text_color": label.text_color,
-            "background_color": label.background_color,
-            "wire_keys": label.wire_keys,
-        }
-        if label.connector_instance_id:
-            label_data["connector_instance_id"] = label.connector_instance_id
-        if label.cable_instance_id:
-            label_data["cable_instance_id"] = label.cable_instance_id
-        if label.cable_end:
-            label_data["cable_end"] = label.cable_end
-        bundle_labels[label.id] = label_data
+    bundle_labels: Dict[str, Any] = {label.id: label.to_dict() for label in harness.labels}
 
     # Build the final structure
     return {
@@ -418,10 +410,7 @@ def harness_to_splice_format(harness: "Harness") -> Dict[str, Any]:
             "wire_anchors": wire_anchors,
             "design_notes": design_notes,
             "bundle_labels": bundle_labels,
-            "label_settings": {
-                "show_labels_on_canvas": harness.label_settings.show_labels_on_canvas,
-                "default_width_mm": harness.label_settings.default_width_mm,
-            },
+            "label_settings": harness.label_settings.to_dict(),
             "name": harness.name,
             "description": harness.description or "",
             "notes": None,
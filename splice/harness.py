@@ -15,12 +15,18 @@ from .components import (
 from .connections import Connection, ConnectionEnd, FlyingLead
 from .utils import DesignatorGenerator
 from .labels import BundleLabel, LabelSettings
+from .notes import DesignNote
 
 try:
     import requests
 except ImportError:
     requests = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class Harness:
     """
@@ -49,7 +55,7 @@ class Harness:
         self.description = description
         self.components: List[ComponentInstance] = []
         self.connections: List[Connection] = []
-        self.notes: List[Dict[str, Any]] = []
+        self.notes: List[DesignNote] = []
         self.labels: List[BundleLabel] = []
         self.label_settings = LabelSettings()
         self._designator_gen = DesignatorGenerator()
@@ -84,6 +90,7 @@ class Harness:
 
         Raises:
             ValueError: If required parameters are missing or invalid
+            DuplicateDesignatorError: If the designator is already in use
         """
         # Get category if provided
         category = kwargs.get("category")
@@ -98,7 +105,7 @@ class Harness:
         # Create appropriate component instance based on kind
         component: ComponentInstance
 
-        if kind == ComponentType.CONNECTOR:
+        if kind is ComponentType.CONNECTOR:
             positions = kwargs.get("positions")
             if positions is None:
                 raise ValueError("Connector requires 'positions' parameter")
@@ -113,7 +120,7 @@ class Harness:
                 **{k: v for k, v in kwargs.items() if k not in ["positions", "category"]},
             )
 
-        elif kind == ComponentType.CABLE:
+        elif kind is ComponentType.CABLE:
             cores = kwargs.get("cores")
             if cores is None:
                 raise ValueError("Cable requires 'cores' parameter")
@@ -127,7 +134,7 @@ class Harness:
                 **{k: v for k, v in kwargs.items() if k != "cores"},
             )
 
-        elif kind == ComponentType.WIRE:
+        elif kind is ComponentType.WIRE:
             awg = kwargs.get("awg")
             color = kwargs.get("color")
             if awg is None or color is None:
@@ -209,7 +216,7 @@ class Harness:
 
     def add_note(
         self, position: Tuple[float, float], title: str, content: List[str]
-    ) -> None:
+    ) -> DesignNote:
         """
         Add a design note to the harness.
 
@@ -217,10 +224,13 @@ class Harness:
             position: (x, y) position on canvas
             title: Note title
             content: List of note content lines
+
+        Returns:
+            The created DesignNote object
         """
-        self.notes.append(
-            {"position": {"x": position[0], "y": position[1]}, "title": title, "content": content}
-        )
+        note = DesignNote(x=position[0], y=position[1], title=title, content=content)
+        self.notes.append(note)
+        return note
 
     def add_label(
         self,
@@ -368,26 +378,57 @@ class Harness:
 
         return harness_to_splice_format(self)
 
-    def to_json(self) -> str:
+    def to_json(self, indent: Optional[int] = 2) -> str:
         """
         Convert harness to JSON string in Splice import format.
 
+        Uses orjson for encoding when it is installed, falling back to the
+        standard library json module otherwise. Both encoders stringify
+        non-str dict keys and keep non-ASCII text unescaped; orjson writes
+        NaN/Infinity floats as null.
+
+        Args:
+            indent: Spaces per indentation level, or None for compact output
+
         Returns:
             JSON string representation compatible with Splice JSON import
         """
-        return json.dumps(self.to_dict(), indent=2)
+        data = self.to_dict()
+        # orjson only supports compact output or a two-space indent
+        if orjson is not None and indent in (None, 2):
+            # Stringify non-str keys (e.g. int pin_mapping keys) like json does
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option).decode()
+        # ensure_ascii=False matches orjson, which never escapes non-ASCII text
+        if indent is None:
+            return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return json.dumps(data, indent=indent, ensure_ascii=False)
 
     def save(self, filepath: str) -> None:
         """
         Save harness to a JSON file in Splice import format.
 
-        The generated JSON file can be uploaded to Splice via the web interface.
+        The generated JSON file is UTF-8 encoded and can be uploaded to Splice
+        via the web interface.
 
         Args:
             filepath: Path to output file
         """
-        with open(filepath, "w") as f:
-            f.write(self.to_json())
+        if orjson is not None:
+            # Write the encoded bytes directly, skipping the str round-trip
+            with open(filepath, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        self.to_dict(), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+                    )
+                )
+            return
+
+        # json.dump encodes incrementally instead of building the full string first
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
 
     def upload(
         self,
@@ -3,7 +3,7 @@ Label classes for bundle identification and heat-shrink printing.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Dict, Any
 import uuid
 
 
@@ -42,6 +42,26 @@ class BundleLabel:
     background_color: str = "#FFFFFF"
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert label to dictionary representation."""
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "label_text": self.label_text,
+            "is_auto_generated": self.is_auto_generated,
+            "width_mm": self.width_mm,
+            "font_size": self.font_size,
+            "text_color": self.text_color,
+            "background_color": self.background_color,
+            "wire_keys": self.wire_keys,
+        }
+        if self.connector_instance_id:
+            data["connector_instance_id"] = self.connector_instance_id
+        if self.cable_instance_id:
+            data["cable_instance_id"] = self.cable_instance_id
+        if self.cable_end:
+            data["cable_end"] = self.cable_end
+        return data
+
 
 @dataclass
 class LabelSettings:
@@ -58,3 +78,10 @@ class LabelSettings:
 
     show_labels_on_canvas: bool = True
     default_width_mm: float = 9.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert settings to dictionary representation."""
+        return {
+            "show_labels_on_canvas": self.show_labels_on_canvas,
+            "default_width_mm": self.default_width_mm,
+        }
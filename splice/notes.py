@@ -0,0 +1,53 @@
+"""
+Design note classes for canvas annotations.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class DesignNote:
+    """
+    Free-form note placed on the harness canvas.
+
+    Attributes:
+        x: Canvas x position
+        y: Canvas y position
+        title: Note title
+        content: Note content lines
+    """
+
+    x: float
+    y: float
+    title: str
+    content: List[str] = field(default_factory=list)
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Support read-only dict-style access used when notes were stored as dicts.
+
+        note["position"] returns a new {"x", "y"} dict, so writing through it
+        does not change the note; set note.x / note.y instead.
+        """
+        if key == "position":
+            return {"x": self.x, "y": self.y}
+        if key in ("title", "content"):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get() for code written against dict notes."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert note to dictionary representation."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "title": self.title,
+            "content": self.content,
+        }
@@ -31,6 +31,14 @@ class ComponentType(Enum):
     TERMINAL = "terminal"
 
 
+# Component type to designator prefix mapping
+KIND_DESIGNATORS = {
+    ComponentType.CONNECTOR: "X",
+    ComponentType.CABLE: "C",
+    ComponentType.WIRE: "W",
+    ComponentType.TERMINAL: "T",
+}
+
 # Category to designator prefix mapping
 CATEGORY_DESIGNATORS = {
     "fuse": "F",
@@ -56,13 +64,4 @@ def get_designator_prefix(kind: ComponentType, category: Optional[str] = None) -
     if category and category in CATEGORY_DESIGNATORS:
         return CATEGORY_DESIGNATORS[category]
 
-    if kind == ComponentType.CONNECTOR:
-        return "X"
-    elif kind == ComponentType.CABLE:
-        return "C"
-    elif kind == ComponentType.WIRE:
-        return "W"
-    elif kind == ComponentType.TERMINAL:
-        return "T"
-
-    return "X"  # Default fallback
+    return KIND_DESIGNATORS.get(kind, "X")  # Default fallback
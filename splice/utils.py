@@ -6,6 +6,10 @@ from typing import Set, Optional
 from .types import ComponentType, get_designator_prefix
 
 
+class DuplicateDesignatorError(ValueError):
+    """Raised when a designator is already used in the harness."""
+
+
 class DesignatorGenerator:
     """
     Generates unique designators for components based on their type and category.
@@ -32,12 +36,12 @@ class DesignatorGenerator:
             A unique designator string (e.g., "X1", "W2", "F1")
 
         Raises:
-            ValueError: If the custom designator is already in use
+            DuplicateDesignatorError: If the custom designator is already in use
         """
         # If custom designator provided, validate and use it
         if custom:
             if custom in self._used_designators:
-                raise ValueError(f"Designator '{custom}' is already in use")
+                raise DuplicateDesignatorError(f"Designator '{custom}' is already in use")
             self._used_designators.add(custom)
             return custom
 
@@ -66,10 +70,10 @@ class DesignatorGenerator:
             designator: The designator to register
 
         Raises:
-            ValueError: If the designator is already registered
+            DuplicateDesignatorError: If the designator is already registered
         """
         if designator in self._used_designators:
-            raise ValueError(f"Designator '{designator}' is already registered")
+            raise DuplicateDesignatorError(f"Designator '{designator}' is already registered")
         self._used_designators.add(designator)
 
     def is_used(self, designator: str) -> bool:
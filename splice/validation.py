@@ -2,7 +2,7 @@
 Validation logic for harness designs.
 """
 
-from typing import List, Set, TYPE_CHECKING
+from typing import List, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .harness import Harness
@@ -20,21 +20,31 @@ class ValidationResult:
         valid: Whether the harness is valid
         errors: List of validation error messages
         warnings: List of validation warning messages
+        error_codes: Stable codes of the errors found, e.g. "missing_mpn"
+        warning_codes: Stable codes of the warnings found, e.g. "unconnected_pins"
     """
 
+    __slots__ = ("valid", "errors", "warnings", "error_codes", "warning_codes", "__weakref__")
+
     def __init__(self) -> None:
         self.valid = True
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.error_codes: Set[str] = set()
+        self.warning_codes: Set[str] = set()
 
-    def add_error(self, message: str) -> None:
-        """Add an error message and mark as invalid."""
+    def add_error(self, message: str, code: Optional[str] = None) -> None:
+        """Add an error message (and its code, if given) and mark as invalid."""
         self.errors.append(message)
+        if code is not None:
+            self.error_codes.add(code)
         self.valid = False
 
-    def add_warning(self, message: str) -> None:
-        """Add a warning message."""
+    def add_warning(self, message: str, code: Optional[str] = None) -> None:
+        """Add a warning message (and its code, if given)."""
         self.warnings.append(message)
+        if code is not None:
+            self.warning_codes.add(code)
 
 
 def validate_harness(harness: "Harness") -> ValidationResult:
@@ -58,45 +68,58 @@ def validate_harness(harness: "Harness") -> ValidationResult:
 
     # Check for empty harness
     if not harness.components:
-        result.add_error("Harness has no components")
+        result.add_error("Harness has no components", "no_components")
         return result
 
     # Check for duplicate designators
     designators: Set[str] = set()
     for component in harness.components:
         if component.designator in designators:
-            result.add_error(f"Duplicate designator: {component.designator}")
+            result.add_error(
+                f"Duplicate designator: {component.designator}", "duplicate_designator"
+            )
         designators.add(component.designator)
 
+    # Core numbers per cable object (not designator, which may be duplicated),
+    # computed once and reused for connection checks
+    cable_core_numbers: dict[int, Set[int]] = {}
+
     # Validate component fields
     for component in harness.components:
         if not component.mpn:
-            result.add_error(f"Component {component.designator} missing MPN")
+            result.add_error(f"Component {component.designator} missing MPN", "missing_mpn")
         if not component.manufacturer:
-            result.add_error(f"Component {component.designator} missing manufacturer")
+            result.add_error(
+                f"Component {component.designator} missing manufacturer", "missing_manufacturer"
+            )
 
         # Validate connector positions
         if isinstance(component, ConnectorInstance):
             if component.positions < 1:
                 result.add_error(
-                    f"Connector {component.designator} has invalid positions: {component.positions}"
+                    f"Connector {component.designator} has invalid positions: "
+                    f"{component.positions}",
+                    "invalid_positions",
                 )
 
         # Validate cable cores
         if isinstance(component, CableInstance):
             if not component.cores:
-                result.add_error(f"Cable {component.designator} has no cores")
+                result.add_error(f"Cable {component.designator} has no cores", "no_cores")
             core_numbers = set()
             for core in component.cores:
                 if core.number < 1:
                     result.add_error(
-                        f"Cable {component.designator} has invalid core number: {core.number}"
+                        f"Cable {component.designator} has invalid core number: {core.number}",
+                        "invalid_core_number",
                     )
                 if core.number in core_numbers:
                     result.add_error(
-                        f"Cable {component.designator} has duplicate core number: {core.number}"
+                        f"Cable {component.designator} has duplicate core number: {core.number}",
+                        "duplicate_core",
                     )
                 core_numbers.add(core.number)
+            cable_core_numbers[id(component)] = core_numbers
 
     # Build component lookup
     component_lookup = {c.designator: c for c in harness.components}
@@ -110,97 +133,63 @@ def validate_harness(harness: "Harness") -> ValidationResult:
         # Validate wire is present (unless at least one end is a cable core)
         if connection.wire is None:
             if not (isinstance(connection.end1, CoreRef) or isinstance(connection.end2, CoreRef)):
-                result.add_error(f"Connection {i} missing wire specification")
-
-        # Validate end1
-        if isinstance(connection.end1, PinRef):
-            designator = connection.end1.component.designator
-            pin = connection.end1.pin
-
-            if designator not in component_lookup:
-                result.add_error(f"Connection {i} references unknown component: {designator}")
-            else:
-                component = component_lookup[designator]
-                if isinstance(component, ConnectorInstance):
-                    if pin < 1 or pin > component.positions:
-                        result.add_error(
-                            f"Connection {i} references invalid pin {pin} on {designator} "
-                            f"(valid range: 1-{component.positions})"
-                        )
-
-            # Track pin usage
-            if designator not in pin_usage:
-                pin_usage[designator] = set()
-            if pin in pin_usage[designator]:
-                result.add_warning(f"Pin {designator}.{pin} used in multiple connections")
-            pin_usage[designator].add(pin)
-
-        elif isinstance(connection.end1, CoreRef):
-            designator = connection.end1.component.designator
-            core = connection.end1.core
-
-            if designator not in component_lookup:
-                result.add_error(f"Connection {i} references unknown component: {designator}")
-            else:
-                component = component_lookup[designator]
-                if isinstance(component, CableInstance):
-                    valid_cores = {c.number for c in component.cores}
-                    if core not in valid_cores:
-                        result.add_error(
-                            f"Connection {i} references invalid core {core} on {designator}"
-                        )
-
-            # Track core usage
-            if designator not in core_usage:
-                core_usage[designator] = {}
-            if core not in core_usage[designator]:
-                core_usage[designator][core] = 0
-            core_usage[designator][core] += 1
-
-        # Validate end2 (same logic as end1)
-        if isinstance(connection.end2, PinRef):
-            designator = connection.end2.component.designator
-            pin = connection.end2.pin
-
-            if designator not in component_lookup:
-                result.add_error(f"Connection {i} references unknown component: {designator}")
-            else:
-                component = component_lookup[designator]
-                if isinstance(component, ConnectorInstance):
-                    if pin < 1 or pin > component.positions:
-                        result.add_error(
-                            f"Connection {i} references invalid pin {pin} on {designator} "
-                            f"(valid range: 1-{component.positions})"
-                        )
-
-            # Track pin usage
-            if designator not in pin_usage:
-                pin_usage[designator] = set()
-            if pin in pin_usage[designator]:
-                result.add_warning(f"Pin {designator}.{pin} used in multiple connections")
-            pin_usage[designator].add(pin)
-
-        elif isinstance(connection.end2, CoreRef):
-            designator = connection.end2.component.designator
-            core = connection.end2.core
-
-            if designator not in component_lookup:
-                result.add_error(f"Connection {i} references unknown component: {designator}")
-            else:
-                component = component_lookup[designator]
-                if isinstance(component, CableInstance):
-                    valid_cores = {c.number for c in component.cores}
-                    if core not in valid_cores:
-                        result.add_error(
-                            f"Connection {i} references invalid core {core} on {designator}"
-                        )
-
-            # Track core usage
-            if designator not in core_usage:
-                core_usage[designator] = {}
-            if core not in core_usage[designator]:
-                core_usage[designator][core] = 0
-            core_usage[designator][core] += 1
+                result.add_error(f"Connection {i} missing wire specification", "missing_wire")
+
+        # Validate both ends the same way
+        for end in (connection.end1, connection.end2):
+            if isinstance(end, PinRef):
+                designator = end.component.designator
+                pin = end.pin
+
+                if designator not in component_lookup:
+                    result.add_error(
+                        f"Connection {i} references unknown component: {designator}",
+                        "unknown_component",
+                    )
+                else:
+                    component = component_lookup[designator]
+                    if isinstance(component, ConnectorInstance):
+                        if pin < 1 or pin > component.positions:
+                            result.add_error(
+                                f"Connection {i} references invalid pin {pin} on {designator} "
+                                f"(valid range: 1-{component.positions})",
+                                "invalid_pin",
+                            )
+
+                # Track pin usage
+                if designator not in pin_usage:
+                    pin_usage[designator] = set()
+                if pin in pin_usage[designator]:
+                    result.add_warning(
+                        f"Pin {designator}.{pin} used in multiple connections",
+                        "multiple_pin_connections",
+                    )
+                pin_usage[designator].add(pin)
+
+            elif isinstance(end, CoreRef):
+                designator = end.component.designator
+                core = end.core
+
+                if designator not in component_lookup:
+                    result.add_error(
+                        f"Connection {i} references unknown component: {designator}",
+                        "unknown_component",
+                    )
+                else:
+                    component = component_lookup[designator]
+                    if isinstance(component, CableInstance):
+                        if core not in cable_core_numbers[id(component)]:
+                            result.add_error(
+                                f"Connection {i} references invalid core {core} on {designator}",
+                                "invalid_core",
+                            )
+
+                # Track core usage
+                if designator not in core_usage:
+                    core_usage[designator] = {}
+                if core not in core_usage[designator]:
+                    core_usage[designator][core] = 0
+                core_usage[designator][core] += 1
 
     # Check for cable cores with too many connections (max 2: one on each end)
     for designator, cores in core_usage.items():
@@ -208,7 +197,8 @@ def validate_harness(harness: "Harness") -> ValidationResult:
             if count > 2:
                 result.add_error(
                     f"Cable core {designator}.{core} has {count} connection(s), maximum is 2 "
-                    f"(one on each side of the core)"
+                    f"(one on each side of the core)",
+                    "max_connections_exceeded",
                 )
 
     # Check for unconnected pins (warning only)
@@ -219,16 +209,18 @@ def validate_harness(harness: "Harness") -> ValidationResult:
             unconnected = total_pins - used_pins
             if unconnected:
                 result.add_warning(
-                    f"Connector {component.designator} has unconnected pins: {sorted(unconnected)}"
+                    f"Connector {component.designator} has unconnected pins: {sorted(unconnected)}",
+                    "unconnected_pins",
                 )
 
         elif isinstance(component, CableInstance):
             used_cores = set(core_usage.get(component.designator, {}).keys())
-            total_cores = {c.number for c in component.cores}
+            total_cores = cable_core_numbers[id(component)]
             unconnected = total_cores - used_cores
             if unconnected:
                 result.add_warning(
-                    f"Cable {component.designator} has unconnected cores: {sorted(unconnected)}"
+                    f"Cable {component.designator} has unconnected cores: {sorted(unconnected)}",
+                    "unconnected_cores",
                 )
 
     return result
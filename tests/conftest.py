@@ -1,7 +1,16 @@
 """
 Pytest configuration and shared fixtures for splice-py tests.
+
+Fixture scoping policy: harnesses are mutable and are always built per test
+(function scope), so no teardown is needed. Only immutable-by-convention
+objects such as wires and unattached labels are session-scoped; tests must
+never mutate them. A wider-scoped harness fixture must be read-only, or yield
+and reset its state in teardown.
 """
 
+import itertools
+import uuid
+
 import pytest
 from splice import (
     Harness,
@@ -14,49 +23,102 @@ from splice import (
     ConnectorGender,
     ConnectorShape,
     FlyingLeadType,
+    ConductorType,
+    BundleLabel,
 )
 
 
+# Shared read-only core for single-core test cables; each cable gets its own list
+_RED_CORE = CableCore(1, awg=18, color=WireColor.RED)
+
+
+def pytest_configure(config):
+    """Materialize enum member maps once, before collection starts."""
+    for enum_cls in (
+        ComponentType,
+        WireColor,
+        ConnectorGender,
+        ConnectorShape,
+        ConductorType,
+        FlyingLeadType,
+        ConnectorCategory,
+    ):
+        list(enum_cls)
+
+
+@pytest.fixture(autouse=True)
+def _fast_uuid(monkeypatch, request):
+    """Replace uuid4 with a counter; opt out with @pytest.mark.real_uuid."""
+    if "real_uuid" in request.keywords:
+        return
+    counter = itertools.count(1)
+    monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
+
+
 @pytest.fixture
 def empty_harness():
     """Create an empty harness for testing."""
     return Harness("Test Harness", "Test description")
 
 
-@pytest.fixture
-def wire_red_20awg():
+@pytest.fixture(scope="session")
+def wire_catalog():
+    """Common hook-up wires keyed by color and gauge, built once per session."""
+    return {
+        "red20": Wire(
+            mpn="20AWG-RED",
+            manufacturer="Generic",
+            awg=20,
+            color=WireColor.RED,
+            description="20 AWG Red Hook-up Wire",
+        ),
+        "black20": Wire(
+            mpn="20AWG-BLK",
+            manufacturer="Generic",
+            awg=20,
+            color=WireColor.BLACK,
+            description="20 AWG Black Hook-up Wire",
+        ),
+        "red18": Wire(
+            mpn="18AWG-RED",
+            manufacturer="Generic",
+            awg=18,
+            color=WireColor.RED,
+            description="18 AWG Red Hook-up Wire",
+        ),
+        "black18": Wire(
+            mpn="18AWG-BLK",
+            manufacturer="Generic",
+            awg=18,
+            color=WireColor.BLACK,
+            description="18 AWG Black Hook-up Wire",
+        ),
+        "green18": Wire(
+            mpn="18AWG-GRN",
+            manufacturer="Generic",
+            awg=18,
+            color=WireColor.GREEN,
+            description="18 AWG Green Hook-up Wire",
+        ),
+    }
+
+
+@pytest.fixture(scope="session")
+def wire_red_20awg(wire_catalog):
     """Create a standard red 20AWG wire."""
-    return Wire(
-        mpn="20AWG-RED",
-        manufacturer="Generic",
-        awg=20,
-        color=WireColor.RED,
-        description="20 AWG Red Hook-up Wire",
-    )
+    return wire_catalog["red20"]
 
 
-@pytest.fixture
-def wire_black_20awg():
+@pytest.fixture(scope="session")
+def wire_black_20awg(wire_catalog):
     """Create a standard black 20AWG wire."""
-    return Wire(
-        mpn="20AWG-BLK",
-        manufacturer="Generic",
-        awg=20,
-        color=WireColor.BLACK,
-        description="20 AWG Black Hook-up Wire",
-    )
+    return wire_catalog["black20"]
 
 
-@pytest.fixture
-def wire_green_18awg():
+@pytest.fixture(scope="session")
+def wire_green_18awg(wire_catalog):
     """Create a standard green 18AWG wire."""
-    return Wire(
-        mpn="18AWG-GRN",
-        manufacturer="Generic",
-        awg=18,
-        color=WireColor.GREEN,
-        description="18 AWG Green Hook-up Wire",
-    )
+    return wire_catalog["green18"]
 
 
 @pytest.fixture
@@ -88,6 +150,70 @@ def basic_cable(empty_harness):
     )
 
 
+@pytest.fixture
+def make_connector(empty_harness):
+    """
+    Factory for test connectors on the empty harness.
+
+    Connectors go through add_component so designators are registered
+    normally. The MPN defaults to CONN-<n> for the n-th component.
+    """
+
+    def _make(positions=2, mpn=None, **kwargs):
+        if mpn is None:
+            mpn = f"CONN-{len(empty_harness.components) + 1}"
+        return empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn=mpn,
+            manufacturer="Test",
+            positions=positions,
+            **kwargs,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def connector_x1(make_connector):
+    """Create a 2-position connector (X1) on the empty harness."""
+    return make_connector()
+
+
+@pytest.fixture
+def make_label(empty_harness, connector_x1):
+    """Factory for labels on the empty harness, attached to X1 unless a cable is given."""
+
+    def _make(text="TEST", **kwargs):
+        if "cable" not in kwargs:
+            kwargs.setdefault("connector", connector_x1)
+        return empty_harness.add_label(text=text, **kwargs)
+
+    return _make
+
+
+@pytest.fixture
+def harness_with_two_connectors(empty_harness, connector_x1, make_connector):
+    """Create a harness with two 2-position connectors (X1, X2)."""
+    return empty_harness, connector_x1, make_connector()
+
+
+@pytest.fixture
+def cable_c1(empty_harness):
+    """Create a single-core cable (C1) on the empty harness."""
+    return empty_harness.add_component(
+        kind=ComponentType.CABLE,
+        mpn="CABLE-1",
+        manufacturer="Test",
+        cores=[_RED_CORE],
+    )
+
+
+@pytest.fixture(scope="session")
+def stranger_label():
+    """Create a label that belongs to no harness."""
+    return BundleLabel(label_text="FAKE")
+
+
 @pytest.fixture
 def flying_lead_tinned():
     """Create a tinned flying lead."""
@@ -2,6 +2,8 @@
 Tests for component classes.
 """
 
+import weakref
+
 import pytest
 from splice import (
     Harness,
@@ -53,6 +55,16 @@ class TestPinRef:
         assert "X1" in repr(pin_ref)
         assert "2" in repr(pin_ref)
 
+    def test_slots_reject_unknown_attributes(self, connector_x1):
+        """Test that PinRef rejects ad-hoc attributes."""
+        with pytest.raises(AttributeError):
+            connector_x1.pin(1).notes = "extra"
+
+    def test_supports_weakref(self, connector_x1):
+        """Test that PinRef can be weakly referenced."""
+        pin_ref = connector_x1.pin(1)
+        assert weakref.ref(pin_ref)() is pin_ref
+
 
 class TestCoreRef:
     """Tests for CoreRef class."""
@@ -165,10 +177,20 @@ class TestConnectorInstance:
         assert data["mpn"] == "CONN-1"
         assert data["manufacturer"] == "Test"
         assert data["positions"] == 3
-        assert data["position"] == {"x": 100, "y": 200}
+        pos = data["position"]
+        assert (pos["x"], pos["y"]) == (100, 200)
         assert data["contact_gender"] == "female"
         assert data["shape"] == "rectangular"
 
+    def test_slots_reject_unknown_attributes(self, connector_x1):
+        """Test that connectors reject ad-hoc attributes."""
+        with pytest.raises(AttributeError):
+            connector_x1.notes = "extra"
+
+    def test_supports_weakref(self, connector_x1):
+        """Test that connectors can be weakly referenced."""
+        assert weakref.ref(connector_x1)() is connector_x1
+
 
 class TestCableInstance:
     """Tests for CableInstance class."""
@@ -2,6 +2,8 @@
 Tests for connection and termination classes.
 """
 
+import weakref
+
 import pytest
 from splice import (
     Harness,
@@ -276,6 +278,13 @@ class TestConnection:
         assert data["end2"]["type"] == "flying_lead"
         assert data["end2"]["termination_type"] == "tinned"
 
+    def test_supports_weakref(self, connector_x1, flying_lead_tinned, wire_red_20awg):
+        """Test that slotted connections and flying leads can be weakly referenced."""
+        conn = Connection(end1=connector_x1.pin(1), end2=flying_lead_tinned, wire=wire_red_20awg)
+
+        assert weakref.ref(conn)() is conn
+        assert weakref.ref(flying_lead_tinned)() is flying_lead_tinned
+
 
 class TestHarnessConnect:
     """Tests for Harness.connect() method."""
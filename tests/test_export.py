@@ -2,8 +2,12 @@
 Tests for JSON export functionality.
 """
 
-import pytest
+import itertools
 import json
+import uuid
+
+import pytest
+import splice.harness
 from splice import (
     Harness,
     ComponentType,
@@ -14,7 +18,8 @@ from splice import (
     ConnectorCategory,
     FlyingLeadType,
 )
-from splice.export import harness_to_splice_format
+from splice.components import ConnectorInstance, PinRef
+from splice.export import harness_to_splice_format, component_to_bom_item
 
 
 class TestHarnessToSpliceFormat:
@@ -122,6 +127,31 @@ class TestBomExport:
         assert wire_item["part"]["mpn"] == "20AWG-RED"
         assert wire_item["unit"] == "ft"
 
+    def test_shared_wire_gets_entry_per_connection(self, empty_harness, wire_red_20awg):
+        """Test that reusing one Wire spec still yields one BOM entry per connection."""
+        x1 = empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-1",
+            manufacturer="Test",
+            positions=2,
+        )
+        x2 = empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-2",
+            manufacturer="Test",
+            positions=2,
+        )
+        empty_harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
+        empty_harness.connect(x1.pin(2), x2.pin(2), wire=wire_red_20awg)
+
+        data = harness_to_splice_format(empty_harness)
+
+        # Mapping keys double as BOM instance IDs, so entries must not be merged
+        assert set(data["data"]["mapping"]) == {"W1", "W2"}
+        assert data["bom"]["W1"]["part"]["mpn"] == "20AWG-RED"
+        assert data["bom"]["W2"]["part"]["mpn"] == "20AWG-RED"
+        assert data["bom"]["W1"]["part"]["id"] != data["bom"]["W2"]["part"]["id"]
+
     def test_connector_spec_in_bom(self, empty_harness):
         """Test that connector spec is included in BOM."""
         empty_harness.add_component(
@@ -232,6 +262,58 @@ class TestMappingExport:
         assert conn["label_end2"] == "PWR"
 
 
+class _CustomConnector(ConnectorInstance):
+    """Connector subclass, as user code might define."""
+
+
+class _CustomPinRef(PinRef):
+    """Pin reference subclass, as user code might define."""
+
+
+class _CustomFlyingLead(FlyingLead):
+    """Flying lead subclass, as user code might define."""
+
+
+class TestSubclassExport:
+    """Tests that subclasses of public component and endpoint classes export fully."""
+
+    def test_connector_subclass_has_spec(self):
+        """Test that a ConnectorInstance subclass still gets a part spec."""
+        connector = _CustomConnector(
+            designator="X9", mpn="CONN-9", manufacturer="Test", positions=3
+        )
+        item = component_to_bom_item(connector)
+
+        assert item["part"]["spec"]["positions"] == 3
+
+    def test_endpoint_subclasses_in_mapping(self, harness_with_components, wire_red_20awg):
+        """Test that PinRef and FlyingLead subclasses get end1/end2 entries."""
+        harness, x1, _, _ = harness_with_components
+        harness.connect(
+            _CustomPinRef(x1, 2),
+            _CustomFlyingLead(termination_type=FlyingLeadType.TINNED),
+            wire=wire_red_20awg,
+        )
+        data = harness_to_splice_format(harness)
+
+        entry = data["data"]["mapping"]["W2"]
+        assert entry["end1"]["connector_instance"] == "X1"
+        assert entry["end1"]["pin"] == 2
+        assert entry["end2"]["type"] == "flying_lead"
+
+    def test_pin_subclass_on_cable_core(self, harness_with_cable):
+        """Test that a PinRef subclass on a cable core keeps both ends and its label."""
+        harness, x1, x2, c1 = harness_with_cable
+        harness.connect(_CustomPinRef(x1, 1), c1.core(1), label_end1="PWR")
+        harness.connect(c1.core(1), _CustomPinRef(x2, 1))
+        data = harness_to_splice_format(harness)
+
+        (entry,) = data["data"]["mapping"].values()
+        assert entry["end1"]["connector_instance"] == "X1"
+        assert entry["end2"]["connector_instance"] == "X2"
+        assert entry["label_end1"] == "PWR"
+
+
 class TestPositionsExport:
     """Tests for position data export."""
 
@@ -280,6 +362,34 @@ class TestPositionsExport:
 
         assert "X1" not in data["data"]["connector_positions"]
 
+    def test_position_assigned_after_add(self, empty_harness):
+        """Test that a position set after adding the component is exported."""
+        x1 = empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-1",
+            manufacturer="Test",
+            positions=2,
+        )
+        x1.position = (50, 75)
+        data = harness_to_splice_format(empty_harness)
+
+        assert data["data"]["connector_positions"]["X1"] == {"x": 50, "y": 75}
+
+    def test_exports_do_not_share_position_dicts(self, empty_harness):
+        """Test that mutating one export's positions does not leak into the next."""
+        empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-1",
+            manufacturer="Test",
+            positions=2,
+            position=(100, 200),
+        )
+        first = harness_to_splice_format(empty_harness)
+        first["data"]["connector_positions"]["X1"]["x"] = 0
+
+        second = harness_to_splice_format(empty_harness)
+        assert second["data"]["connector_positions"]["X1"]["x"] == 100
+
 
 class TestDesignNotesExport:
     """Tests for design notes export."""
@@ -331,7 +441,7 @@ class TestLabelExportFormat:
         labels = data["data"]["bundle_labels"]
 
         assert len(labels) == 1
-        label_data = list(labels.values())[0]
+        label_data = next(iter(labels.values()))
         assert label_data["label_text"] == "J1"
         assert label_data["connector_instance_id"] == "X1"
         assert label_data["width_mm"] == 12
@@ -377,6 +487,14 @@ class TestJsonOutput:
         # Pretty-printed JSON should have newlines
         assert "\n" in json_str
 
+    def test_to_json_compact(self, harness_with_components):
+        """Test that to_json(indent=None) produces compact JSON."""
+        harness, _, _, _ = harness_with_components
+        json_str = harness.to_json(indent=None)
+
+        assert "\n" not in json_str
+        assert json.loads(json_str)["data"]["name"] == harness.name
+
     def test_to_dict_matches_to_json(self, harness_with_components):
         """Test that to_dict() and to_json() produce equivalent structure."""
         harness, _, _, _ = harness_with_components
@@ -431,3 +549,91 @@ class TestSaveToFile:
         assert set(file_data.keys()) == set(dict_data.keys())
         assert set(file_data["data"].keys()) == set(dict_data["data"].keys())
         assert set(file_data["bom"].keys()) == set(dict_data["bom"].keys())
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (if installed) and once with the json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(splice.harness, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def int_keyed_harness(harness_with_components):
+    """Harness whose connector custom_fields use int keys and non-ASCII text."""
+    harness, _, _, _ = harness_with_components
+    harness.description = "Kabelbaum für Prüfstand"
+    harness.add_component(
+        kind=ComponentType.CONNECTOR,
+        mpn="CONN-MAP",
+        manufacturer="Test",
+        positions=2,
+        pin_mapping={0: "VCC", 1: "GND"},
+    )
+    return harness
+
+
+def _pin_mapping(data):
+    """Return the pin_mapping of the int-keyed connector (X3) from exported data."""
+    return data["bom"]["X3"]["part"]["spec"]["pin_mapping"]
+
+
+class TestJsonBackends:
+    """Tests that the orjson and json encoders produce the same output."""
+
+    @pytest.mark.parametrize("indent", [2, None], ids=["indent2", "compact"])
+    def test_to_json_int_keys(self, json_backend, int_keyed_harness, indent):
+        """Test that to_json() stringifies non-str dict keys with either encoder."""
+        data = json.loads(int_keyed_harness.to_json(indent=indent))
+
+        assert _pin_mapping(data) == {"0": "VCC", "1": "GND"}
+        assert data["data"]["description"] == "Kabelbaum für Prüfstand"
+
+    def test_to_json_keeps_non_ascii(self, json_backend, int_keyed_harness):
+        """Test that both encoders write non-ASCII text unescaped."""
+        assert "Kabelbaum für Prüfstand" in int_keyed_harness.to_json()
+        assert "Kabelbaum für Prüfstand" in int_keyed_harness.to_json(indent=None)
+
+    def test_save_int_keys(self, json_backend, int_keyed_harness, tmp_path):
+        """Test that save() stringifies non-str dict keys with either encoder."""
+        filepath = tmp_path / "test.json"
+        int_keyed_harness.save(str(filepath))
+
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert _pin_mapping(data) == {"0": "VCC", "1": "GND"}
+        assert "Kabelbaum für Prüfstand".encode("utf-8") in filepath.read_bytes()
+
+    @pytest.mark.parametrize("indent", [2, None], ids=["indent2", "compact"])
+    def test_encoders_agree(self, int_keyed_harness, monkeypatch, indent):
+        """Test that orjson and the json fallback produce identical text."""
+        pytest.importorskip("orjson")
+
+        def encode():
+            # Restart the uuid counter so both exports get the same ids
+            counter = itertools.count(1)
+            monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
+            return int_keyed_harness.to_json(indent=indent)
+
+        fast = encode()
+        monkeypatch.setattr(splice.harness, "orjson", None)
+        assert encode() == fast
+
+    def test_saved_files_agree(self, int_keyed_harness, monkeypatch, tmp_path):
+        """Test that save() writes identical bytes with either encoder."""
+        pytest.importorskip("orjson")
+
+        def save(name):
+            counter = itertools.count(1)
+            monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
+            filepath = tmp_path / name
+            int_keyed_harness.save(str(filepath))
+            return filepath.read_bytes()
+
+        fast = save("orjson.json")
+        monkeypatch.setattr(splice.harness, "orjson", None)
+        assert save("stdlib.json") == fast
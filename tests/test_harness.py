@@ -13,6 +13,7 @@ from splice import (
     WireColor,
     ConnectorCategory,
     FlyingLeadType,
+    DesignNote,
 )
 
 
@@ -96,6 +97,30 @@ class TestAddComponent:
         )
         assert connector.designator == "J5"
 
+    def test_auto_designator_skips_custom_designator(self, empty_harness):
+        """Test that auto-generated designators never collide with custom ones."""
+        empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-1",
+            manufacturer="Test",
+            positions=2,
+            designator="X2",
+        )
+        c1 = empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-2",
+            manufacturer="Test",
+            positions=2,
+        )
+        c2 = empty_harness.add_component(
+            kind=ComponentType.CONNECTOR,
+            mpn="CONN-3",
+            manufacturer="Test",
+            positions=2,
+        )
+        assert c1.designator == "X1"
+        assert c2.designator == "X3"
+
     def test_add_connector_with_category(self, empty_harness):
         """Test adding connectors with category-specific designators."""
         ps1 = empty_harness.add_component(
@@ -252,6 +277,27 @@ class TestAddNote:
         assert note["title"] == "Test Note"
         assert note["content"] == ["Line 1", "Line 2"]
 
+    def test_add_note_returns_design_note(self, empty_harness):
+        """Test that add_note returns the stored DesignNote."""
+        note = empty_harness.add_note(
+            position=(100, 200),
+            title="Test Note",
+            content=["Line 1"],
+        )
+        assert isinstance(note, DesignNote)
+        assert empty_harness.notes[0] is note
+        assert (note.x, note.y) == (100, 200)
+        assert note.title == "Test Note"
+
+    def test_note_dict_style_get(self, empty_harness):
+        """Test that get() works as it did on dict notes."""
+        note = empty_harness.add_note((100, 200), "Test Note", ["Line 1"])
+
+        assert note.get("title", "") == "Test Note"
+        assert note.get("position") == {"x": 100, "y": 200}
+        assert note.get("color") is None
+        assert note.get("color", "#FFF") == "#FFF"
+
     def test_add_multiple_notes(self, empty_harness):
         """Test adding multiple notes."""
         empty_harness.add_note((0, 0), "Note 1", ["Content 1"])
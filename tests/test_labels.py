@@ -2,82 +2,110 @@
 Tests for label classes and harness label methods.
 """
 
+import re
+
 import pytest
 from splice import (
     Harness,
     ComponentType,
-    CableCore,
-    WireColor,
     BundleLabel,
     LabelSettings,
 )
 
+# Error message patterns for add_label/remove_label failures
+_RE_REQUIRES = re.compile(r"connector.*cable")
+_RE_BOTH = re.compile(r"both")
+_RE_NOT_FOUND = re.compile(r"not found")
+
 
 class TestBundleLabel:
     """Tests for BundleLabel class."""
 
-    def test_create_basic_label(self):
-        """Test creating a basic bundle label."""
-        label = BundleLabel(label_text="J1")
-        assert label.label_text == "J1"
-        assert label.is_auto_generated is False
-        assert label.connector_instance_id is None
-        assert label.cable_instance_id is None
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"label_text": "J1"},
+                {
+                    "label_text": "J1",
+                    "is_auto_generated": False,
+                    "connector_instance_id": None,
+                    "cable_instance_id": None,
+                },
+            ),
+            (
+                {"label_text": "TEST"},
+                {
+                    "width_mm": 9.0,
+                    "font_size": 10.0,
+                    "text_color": "#000000",
+                    "background_color": "#FFFFFF",
+                    "wire_keys": [],
+                    "cable_end": None,
+                },
+            ),
+            (
+                {
+                    "label_text": "WARNING",
+                    "width_mm": 15.0,
+                    "font_size": 12.0,
+                    "text_color": "#FFFFFF",
+                    "background_color": "#FF0000",
+                },
+                {
+                    "width_mm": 15.0,
+                    "font_size": 12.0,
+                    "text_color": "#FFFFFF",
+                    "background_color": "#FF0000",
+                },
+            ),
+            (
+                {"label_text": "PWR", "connector_instance_id": "X1"},
+                {"connector_instance_id": "X1", "cable_instance_id": None},
+            ),
+            (
+                {"label_text": "CTRL", "cable_instance_id": "C1", "cable_end": "both"},
+                {"cable_instance_id": "C1", "connector_instance_id": None, "cable_end": "both"},
+            ),
+            (
+                {
+                    "label_text": "SIGNAL",
+                    "connector_instance_id": "X1",
+                    "wire_keys": ["W1", "W2", "W3"],
+                },
+                {"wire_keys": ["W1", "W2", "W3"]},
+            ),
+        ],
+        ids=["basic", "defaults", "custom_styling", "connector", "cable", "wire_keys"],
+    )
+    def test_bundle_label_construction(self, kwargs, expected):
+        """Test constructing labels with various attributes."""
+        label = BundleLabel(**kwargs)
+        for attr, value in expected.items():
+            if value is None or isinstance(value, bool):
+                # None/True/False by identity so 0 or "" cannot stand in for them
+                assert getattr(label, attr) is value
+            else:
+                assert getattr(label, attr) == value
         assert label.id is not None  # Should auto-generate UUID
 
-    def test_label_default_values(self):
-        """Test label default values."""
-        label = BundleLabel(label_text="TEST")
-        assert label.width_mm == 9.0
-        assert label.font_size == 10.0
-        assert label.text_color == "#000000"
-        assert label.background_color == "#FFFFFF"
-        assert label.wire_keys == []
-        assert label.cable_end is None
-
-    def test_label_with_custom_styling(self):
-        """Test label with custom styling."""
-        label = BundleLabel(
-            label_text="WARNING",
-            width_mm=15.0,
-            font_size=12.0,
-            text_color="#FFFFFF",
-            background_color="#FF0000",
-        )
-        assert label.width_mm == 15.0
-        assert label.font_size == 12.0
-        assert label.text_color == "#FFFFFF"
-        assert label.background_color == "#FF0000"
-
-    def test_label_with_connector(self):
-        """Test label attached to connector."""
+    def test_label_to_dict(self):
+        """Test label serialization omits unset attachment fields."""
         label = BundleLabel(
             label_text="PWR",
             connector_instance_id="X1",
+            wire_keys=["W1"],
         )
-        assert label.connector_instance_id == "X1"
-        assert label.cable_instance_id is None
+        data = label.to_dict()
 
-    def test_label_with_cable(self):
-        """Test label attached to cable."""
-        label = BundleLabel(
-            label_text="CTRL",
-            cable_instance_id="C1",
-            cable_end="both",
-        )
-        assert label.cable_instance_id == "C1"
-        assert label.connector_instance_id is None
-        assert label.cable_end == "both"
-
-    def test_label_with_wire_keys(self):
-        """Test label with specific wire keys."""
-        label = BundleLabel(
-            label_text="SIGNAL",
-            connector_instance_id="X1",
-            wire_keys=["W1", "W2", "W3"],
-        )
-        assert label.wire_keys == ["W1", "W2", "W3"]
+        assert data["id"] == label.id
+        assert data["label_text"] == "PWR"
+        assert data["connector_instance_id"] == "X1"
+        assert data["wire_keys"] == ["W1"]
+        assert "cable_instance_id" not in data
+        assert "cable_end" not in data
 
+    @pytest.mark.real_uuid
     def test_label_unique_ids(self):
         """Test that labels get unique IDs."""
         label1 = BundleLabel(label_text="A")
@@ -88,92 +116,59 @@ class TestBundleLabel:
 class TestLabelSettings:
     """Tests for LabelSettings class."""
 
-    def test_default_settings(self):
-        """Test default label settings."""
-        settings = LabelSettings()
-        assert settings.show_labels_on_canvas is True
-        assert settings.default_width_mm == 9.0
-
-    def test_custom_settings(self):
-        """Test custom label settings."""
-        settings = LabelSettings(
-            show_labels_on_canvas=False,
-            default_width_mm=12.0,
-        )
-        assert settings.show_labels_on_canvas is False
-        assert settings.default_width_mm == 12.0
+    @pytest.mark.parametrize(
+        "kwargs,expected_show,expected_width",
+        [
+            ({}, True, 9.0),
+            ({"show_labels_on_canvas": False, "default_width_mm": 12.0}, False, 12.0),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_label_settings(self, kwargs, expected_show, expected_width):
+        """Test default and custom label settings."""
+        settings = LabelSettings(**kwargs)
+        assert settings.show_labels_on_canvas is expected_show
+        assert settings.default_width_mm == expected_width
+
+    def test_settings_to_dict(self):
+        """Test label settings serialization."""
+        settings = LabelSettings(show_labels_on_canvas=False, default_width_mm=12.0)
+        assert settings.to_dict() == {
+            "show_labels_on_canvas": False,
+            "default_width_mm": 12.0,
+        }
 
 
 class TestHarnessAddLabel:
     """Tests for Harness.add_label() method."""
 
-    def test_add_label_to_connector(self, empty_harness):
+    def test_add_label_to_connector(self, empty_harness, make_label):
         """Test adding a label to a connector."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        label = empty_harness.add_label(
-            text="J1",
-            connector=x1,
-        )
+        label = make_label(text="J1")
 
         assert label in empty_harness.labels
         assert label.label_text == "J1"
         assert label.connector_instance_id == "X1"
         assert label.is_auto_generated is False
 
-    def test_add_label_to_cable(self, empty_harness):
+    def test_add_label_to_cable(self, make_label, cable_c1):
         """Test adding a label to a cable."""
-        c1 = empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[CableCore(1, awg=18, color=WireColor.RED)],
-        )
-
-        label = empty_harness.add_label(
-            text="CTRL CABLE",
-            cable=c1,
-            cable_end="both",
-        )
+        label = make_label(text="CTRL CABLE", cable=cable_c1, cable_end="both")
 
         assert label.cable_instance_id == "C1"
         assert label.cable_end == "both"
 
-    def test_add_label_auto_designator(self, empty_harness):
+    def test_add_label_auto_designator(self, make_label):
         """Test adding a label with auto-generated designator."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        label = empty_harness.add_label(
-            text="",
-            connector=x1,
-            auto_designator=True,
-        )
+        label = make_label(text="", auto_designator=True)
 
         assert label.label_text == "X1"
         assert label.is_auto_generated is True
 
-    def test_add_label_with_styling(self, empty_harness):
+    def test_add_label_with_styling(self, make_label):
         """Test adding a label with custom styling."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        label = empty_harness.add_label(
+        label = make_label(
             text="DANGER",
-            connector=x1,
             width_mm=20.0,
             font_size=14.0,
             text_color="#FFFFFF",
@@ -185,72 +180,36 @@ class TestHarnessAddLabel:
         assert label.text_color == "#FFFFFF"
         assert label.background_color == "#FF0000"
 
-    def test_add_label_uses_default_width(self, empty_harness):
+    def test_add_label_uses_default_width(self, empty_harness, make_label):
         """Test that label uses default width from settings."""
         empty_harness.label_settings.default_width_mm = 15.0
 
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        label = empty_harness.add_label(text="TEST", connector=x1)
+        label = make_label()
 
         assert label.width_mm == 15.0
 
-    def test_add_label_with_wire_keys(self, empty_harness):
+    def test_add_label_with_wire_keys(self, make_label):
         """Test adding a label with specific wire keys."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=3,
-        )
-
-        label = empty_harness.add_label(
-            text="PWR",
-            connector=x1,
-            wire_keys=["W1", "W2"],
-        )
+        label = make_label(text="PWR", wire_keys=["W1", "W2"])
 
         assert label.wire_keys == ["W1", "W2"]
 
     def test_add_label_requires_connector_or_cable(self, empty_harness):
         """Test that add_label raises error if neither connector nor cable specified."""
-        with pytest.raises(ValueError, match="connector.*cable"):
+        with pytest.raises(ValueError, match=_RE_REQUIRES):
             empty_harness.add_label(text="TEST")
 
-    def test_add_label_rejects_both_connector_and_cable(self, empty_harness):
+    def test_add_label_rejects_both_connector_and_cable(
+        self, empty_harness, connector_x1, cable_c1
+    ):
         """Test that add_label raises error if both connector and cable specified."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        c1 = empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[CableCore(1, awg=18, color=WireColor.RED)],
-        )
-
-        with pytest.raises(ValueError, match="both"):
-            empty_harness.add_label(text="TEST", connector=x1, cable=c1)
+        with pytest.raises(ValueError, match=_RE_BOTH):
+            empty_harness.add_label(text="TEST", connector=connector_x1, cable=cable_c1)
 
-    def test_add_multiple_labels_to_same_connector(self, empty_harness):
+    def test_add_multiple_labels_to_same_connector(self, empty_harness, make_label):
         """Test adding multiple labels to the same connector."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        label1 = empty_harness.add_label(text="J1", connector=x1)
-        label2 = empty_harness.add_label(text="POWER INPUT", connector=x1)
+        label1 = make_label(text="J1")
+        label2 = make_label(text="POWER INPUT")
 
         assert len(empty_harness.labels) == 2
         assert label1.id != label2.id
@@ -259,187 +218,103 @@ class TestHarnessAddLabel:
 class TestHarnessRemoveLabel:
     """Tests for Harness.remove_label() method."""
 
-    def test_remove_label(self, empty_harness):
+    def test_remove_label(self, empty_harness, make_label):
         """Test removing a label."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        label = empty_harness.add_label(text="TEST", connector=x1)
+        label = make_label()
 
         assert len(empty_harness.labels) == 1
         empty_harness.remove_label(label)
         assert len(empty_harness.labels) == 0
 
-    def test_remove_nonexistent_label_raises(self, empty_harness):
+    def test_remove_nonexistent_label_raises(self, empty_harness, stranger_label):
         """Test that removing a non-existent label raises error."""
-        label = BundleLabel(label_text="FAKE")
-
-        with pytest.raises(ValueError, match="not found"):
-            empty_harness.remove_label(label)
+        with pytest.raises(ValueError, match=_RE_NOT_FOUND):
+            empty_harness.remove_label(stranger_label)
 
 
 class TestHarnessGetLabels:
     """Tests for Harness.get_labels() method."""
 
-    def test_get_all_labels(self, empty_harness):
+    def test_get_all_labels(self, harness_with_two_connectors):
         """Test getting all labels."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
+        harness, x1, x2 = harness_with_two_connectors
 
-        empty_harness.add_label(text="L1", connector=x1)
-        empty_harness.add_label(text="L2", connector=x2)
+        harness.add_label(text="L1", connector=x1)
+        harness.add_label(text="L2", connector=x2)
 
-        labels = empty_harness.get_labels()
+        labels = harness.get_labels()
         assert len(labels) == 2
 
-    def test_get_labels_by_connector(self, empty_harness):
+    def test_get_labels_by_connector(self, harness_with_two_connectors):
         """Test filtering labels by connector."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
+        harness, x1, x2 = harness_with_two_connectors
 
-        empty_harness.add_label(text="L1-A", connector=x1)
-        empty_harness.add_label(text="L1-B", connector=x1)
-        empty_harness.add_label(text="L2", connector=x2)
+        harness.add_label(text="L1-A", connector=x1)
+        harness.add_label(text="L1-B", connector=x1)
+        harness.add_label(text="L2", connector=x2)
 
-        x1_labels = empty_harness.get_labels(connector=x1)
+        x1_labels = harness.get_labels(connector=x1)
         assert len(x1_labels) == 2
-        assert all(l.connector_instance_id == "X1" for l in x1_labels)
+        assert {l.connector_instance_id for l in x1_labels} == {"X1"}
 
-    def test_get_labels_by_cable(self, empty_harness):
+    def test_get_labels_by_cable(self, empty_harness, make_label, cable_c1):
         """Test filtering labels by cable."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        c1 = empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[CableCore(1, awg=18, color=WireColor.RED)],
-        )
+        make_label(text="CONN")
+        make_label(text="CABLE", cable=cable_c1)
 
-        empty_harness.add_label(text="CONN", connector=x1)
-        empty_harness.add_label(text="CABLE", cable=c1)
-
-        cable_labels = empty_harness.get_labels(cable=c1)
+        cable_labels = empty_harness.get_labels(cable=cable_c1)
         assert len(cable_labels) == 1
         assert cable_labels[0].label_text == "CABLE"
 
-    def test_get_labels_empty_result(self, empty_harness):
+    def test_get_labels_empty_result(self, harness_with_two_connectors):
         """Test get_labels returns empty list when no matches."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
+        harness, x1, x2 = harness_with_two_connectors
 
-        empty_harness.add_label(text="L1", connector=x1)
+        harness.add_label(text="L1", connector=x1)
 
-        x2_labels = empty_harness.get_labels(connector=x2)
+        x2_labels = harness.get_labels(connector=x2)
         assert x2_labels == []
 
 
 class TestLabelExport:
     """Tests for label serialization in harness export."""
 
-    def test_labels_in_export(self, empty_harness):
+    def test_labels_in_export(self, empty_harness, make_label):
         """Test that labels are included in harness export."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
+        make_label(text="J1", width_mm=12.0, background_color="#FFFF00")
 
-        empty_harness.add_label(
-            text="J1",
-            connector=x1,
-            width_mm=12.0,
-            background_color="#FFFF00",
-        )
-
-        data = empty_harness.to_dict()
+        payload = empty_harness.to_dict()["data"]
 
-        assert "bundle_labels" in data["data"]
-        labels = data["data"]["bundle_labels"]
+        assert "bundle_labels" in payload
+        labels = payload["bundle_labels"]
         assert len(labels) == 1
 
         # Get the label by its ID
-        label_data = list(labels.values())[0]
+        label_data = next(iter(labels.values()))
         assert label_data["label_text"] == "J1"
         assert label_data["connector_instance_id"] == "X1"
         assert label_data["width_mm"] == 12.0
         assert label_data["background_color"] == "#FFFF00"
 
-    def test_label_settings_in_export(self, empty_harness):
+    def test_label_settings_in_export(self, empty_harness, connector_x1):
         """Test that label settings are included in harness export."""
+        # connector_x1 provides the one component needed for a valid harness
         empty_harness.label_settings.show_labels_on_canvas = False
         empty_harness.label_settings.default_width_mm = 15.0
 
-        # Need at least one component for valid harness
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        data = empty_harness.to_dict()
+        payload = empty_harness.to_dict()["data"]
 
-        assert "label_settings" in data["data"]
-        settings = data["data"]["label_settings"]
+        assert "label_settings" in payload
+        settings = payload["label_settings"]
         assert settings["show_labels_on_canvas"] is False
         assert settings["default_width_mm"] == 15.0
 
-    def test_cable_label_export(self, empty_harness):
+    def test_cable_label_export(self, empty_harness, make_label, cable_c1):
         """Test that cable labels export correctly."""
-        c1 = empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[CableCore(1, awg=18, color=WireColor.RED)],
-        )
-
-        empty_harness.add_label(
-            text="POWER CABLE",
-            cable=c1,
-            cable_end="both",
-        )
+        make_label(text="POWER CABLE", cable=cable_c1, cable_end="both")
 
-        data = empty_harness.to_dict()
-        label_data = list(data["data"]["bundle_labels"].values())[0]
+        labels = empty_harness.to_dict()["data"]["bundle_labels"]
+        label_data = next(iter(labels.values()))
 
         assert label_data["cable_instance_id"] == "C1"
         assert label_data["cable_end"] == "both"
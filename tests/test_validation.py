@@ -2,20 +2,31 @@
 Tests for harness validation.
 """
 
+import weakref
+
 import pytest
 from splice import (
     Harness,
     ComponentType,
-    Wire,
     CableCore,
-    FlyingLead,
     WireColor,
-    FlyingLeadType,
     ValidationResult,
+    DuplicateDesignatorError,
 )
 from splice.validation import validate_harness
 
 
+def _valid_fields(kind):
+    """Return fresh valid fields for a component kind; tests override one at a time."""
+    if kind is ComponentType.CABLE:
+        return {
+            "mpn": "CABLE-1",
+            "manufacturer": "Test",
+            "cores": [CableCore(1, awg=18, color=WireColor.RED)],
+        }
+    return {"mpn": "CONN-1", "manufacturer": "Test", "positions": 2}
+
+
 class TestValidationResult:
     """Tests for ValidationResult class."""
 
@@ -25,6 +36,8 @@ class TestValidationResult:
         assert result.valid is True
         assert result.errors == []
         assert result.warnings == []
+        assert result.error_codes == set()
+        assert result.warning_codes == set()
 
     def test_add_error_marks_invalid(self):
         """Test that adding an error marks result as invalid."""
@@ -42,6 +55,30 @@ class TestValidationResult:
         assert result.valid is True
         assert "Test warning" in result.warnings
 
+    def test_add_error_records_code(self):
+        """Test that an error code is recorded alongside the message."""
+        result = ValidationResult()
+        result.add_error("Component X1 missing MPN", "missing_mpn")
+        result.add_error("Uncoded error")
+
+        assert result.error_codes == {"missing_mpn"}
+        assert len(result.errors) == 2
+
+    def test_add_warning_records_code(self):
+        """Test that a warning code is recorded alongside the message."""
+        result = ValidationResult()
+        result.add_warning("Connector X1 has unconnected pins: [2]", "unconnected_pins")
+
+        assert result.warning_codes == {"unconnected_pins"}
+        assert result.valid is True
+
+    def test_slots(self):
+        """Test that ValidationResult rejects ad-hoc attributes but supports weakrefs."""
+        result = ValidationResult()
+        with pytest.raises(AttributeError):
+            result.extra = True
+        assert weakref.ref(result)() is result
+
     def test_multiple_errors(self):
         """Test multiple errors."""
         result = ValidationResult()
@@ -60,75 +97,38 @@ class TestEmptyHarnessValidation:
         result = empty_harness.validate()
 
         assert result.valid is False
-        assert any("no components" in e.lower() for e in result.errors)
+        # Validation stops at the empty check; no other errors or warnings
+        assert result.error_codes == {"no_components"}
+        assert len(result.errors) == 1
+        assert result.warnings == []
 
 
 class TestComponentValidation:
     """Tests for component validation."""
 
-    def test_valid_connector(self, empty_harness):
+    def test_valid_connector(self, empty_harness, connector_x1):
         """Test that a valid connector passes validation."""
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
         result = empty_harness.validate()
 
         assert result.valid is True
 
-    def test_connector_missing_mpn(self, empty_harness):
-        """Test that connector with missing MPN fails validation."""
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="",  # Empty MPN
-            manufacturer="Test",
-            positions=2,
-        )
-        result = empty_harness.validate()
-
-        assert result.valid is False
-        assert any("mpn" in e.lower() for e in result.errors)
-
-    def test_connector_missing_manufacturer(self, empty_harness):
-        """Test that connector with missing manufacturer fails validation."""
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="",  # Empty manufacturer
-            positions=2,
-        )
+    @pytest.mark.parametrize(
+        "kind,overrides,code",
+        [
+            (ComponentType.CONNECTOR, {"mpn": ""}, "missing_mpn"),
+            (ComponentType.CONNECTOR, {"manufacturer": ""}, "missing_manufacturer"),
+            (ComponentType.CONNECTOR, {"positions": 0}, "invalid_positions"),
+            (ComponentType.CABLE, {"cores": []}, "no_cores"),
+        ],
+        ids=["missing_mpn", "missing_manufacturer", "invalid_positions", "cable_without_cores"],
+    )
+    def test_invalid_component_fields(self, empty_harness, kind, overrides, code):
+        """Test that components with a missing or invalid field fail validation."""
+        empty_harness.add_component(kind=kind, **{**_valid_fields(kind), **overrides})
         result = empty_harness.validate()
 
         assert result.valid is False
-        assert any("manufacturer" in e.lower() for e in result.errors)
-
-    def test_connector_invalid_positions(self, empty_harness):
-        """Test that connector with invalid positions fails validation."""
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=0,  # Invalid
-        )
-        result = empty_harness.validate()
-
-        assert result.valid is False
-        assert any("positions" in e.lower() for e in result.errors)
-
-    def test_cable_without_cores(self, empty_harness):
-        """Test that cable without cores fails validation."""
-        empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[],  # No cores
-        )
-        result = empty_harness.validate()
-
-        assert result.valid is False
-        assert any("no cores" in e.lower() for e in result.errors)
+        assert code in result.error_codes
 
     def test_cable_duplicate_core_numbers(self, empty_harness):
         """Test that cable with duplicate core numbers fails validation."""
@@ -144,47 +144,23 @@ class TestComponentValidation:
         result = empty_harness.validate()
 
         assert result.valid is False
-        assert any("duplicate core" in e.lower() for e in result.errors)
+        assert "duplicate_core" in result.error_codes
 
 
 class TestDuplicateDesignatorValidation:
     """Tests for duplicate designator validation."""
 
-    def test_duplicate_designator_fails(self, empty_harness):
+    def test_duplicate_designator_fails(self, make_connector):
         """Test that duplicate designators are rejected at add time."""
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-            designator="J1",
-        )
+        make_connector(designator="J1")
         # Duplicate designator is rejected when adding the component
-        with pytest.raises(ValueError, match="already registered"):
-            empty_harness.add_component(
-                kind=ComponentType.CONNECTOR,
-                mpn="CONN-2",
-                manufacturer="Test",
-                positions=2,
-                designator="J1",  # Duplicate
-            )
-
-    def test_unique_designators_pass(self, empty_harness):
+        with pytest.raises(DuplicateDesignatorError):
+            make_connector(designator="J1")
+
+    def test_unique_designators_pass(self, empty_harness, make_connector):
         """Test that unique designators pass validation."""
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-            designator="J1",
-        )
-        empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-            designator="J2",
-        )
+        make_connector(designator="J1")
+        make_connector(designator="J2")
         result = empty_harness.validate()
 
         assert result.valid is True
@@ -193,85 +169,35 @@ class TestDuplicateDesignatorValidation:
 class TestConnectionValidation:
     """Tests for connection validation."""
 
-    def test_valid_connection(self, empty_harness, wire_red_20awg):
+    def test_valid_connection(self, harness_with_two_connectors, wire_red_20awg):
         """Test that a valid connection passes validation."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
-        empty_harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
+        harness, x1, x2 = harness_with_two_connectors
+        harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
 
-        result = empty_harness.validate()
+        result = harness.validate()
         assert result.valid is True
 
-    def test_connection_invalid_pin_too_high(self, empty_harness, wire_red_20awg):
-        """Test that connection to invalid pin fails validation."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
-        # Connect to pin 5 on a 2-position connector
-        empty_harness.connect(x1.pin(5), x2.pin(1), wire=wire_red_20awg)
+    @pytest.mark.parametrize(
+        "end_kind,number,code",
+        [("pin", 5, "invalid_pin"), ("pin", 0, "invalid_pin"), ("core", 5, "invalid_core")],
+        ids=["pin_too_high", "pin_zero", "bad_core"],
+    )
+    def test_connection_invalid_end(
+        self, request, empty_harness, make_connector, wire_red_20awg, end_kind, number, code
+    ):
+        """Test that connecting a nonexistent pin or cable core fails validation."""
+        x1 = make_connector()
+        if end_kind == "pin":
+            # Pin outside 1-2 on a 2-position connector
+            empty_harness.connect(x1.pin(number), make_connector().pin(1), wire=wire_red_20awg)
+        else:
+            # Core missing from a 1-core cable
+            c1 = request.getfixturevalue("cable_c1")
+            empty_harness.connect(x1.pin(1), c1.core(number))
 
         result = empty_harness.validate()
         assert result.valid is False
-        assert any("invalid pin" in e.lower() for e in result.errors)
-
-    def test_connection_invalid_pin_zero(self, empty_harness, wire_red_20awg):
-        """Test that connection to pin 0 fails validation."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
-        empty_harness.connect(x1.pin(0), x2.pin(1), wire=wire_red_20awg)
-
-        result = empty_harness.validate()
-        assert result.valid is False
-
-    def test_connection_invalid_cable_core(self, empty_harness):
-        """Test that connection to invalid cable core fails validation."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        c1 = empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[CableCore(1, awg=18, color=WireColor.RED)],
-        )
-        # Connect to core 5 on a 1-core cable
-        empty_harness.connect(x1.pin(1), c1.core(5))
-
-        result = empty_harness.validate()
-        assert result.valid is False
-        assert any("invalid core" in e.lower() for e in result.errors)
+        assert code in result.error_codes
 
 
 class TestCableConnectionValidation:
@@ -288,76 +214,39 @@ class TestCableConnectionValidation:
         result = harness.validate()
         assert result.valid is True
 
-    def test_cable_core_too_many_connections(self, empty_harness):
+    def test_cable_core_too_many_connections(self, empty_harness, make_connector, cable_c1):
         """Test that cable core with > 2 connections fails validation."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=3,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=3,
-        )
-        x3 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-3",
-            manufacturer="Test",
-            positions=3,
-        )
-        c1 = empty_harness.add_component(
-            kind=ComponentType.CABLE,
-            mpn="CABLE-1",
-            manufacturer="Test",
-            cores=[CableCore(1, awg=18, color=WireColor.RED)],
-        )
+        x1 = make_connector(positions=3)
+        x2 = make_connector(positions=3)
+        x3 = make_connector(positions=3)
 
         # Three connections to same core - invalid
-        empty_harness.connect(x1.pin(1), c1.core(1))
-        empty_harness.connect(c1.core(1), x2.pin(1))
-        empty_harness.connect(c1.core(1), x3.pin(1))
+        empty_harness.connect(x1.pin(1), cable_c1.core(1))
+        empty_harness.connect(cable_c1.core(1), x2.pin(1))
+        empty_harness.connect(cable_c1.core(1), x3.pin(1))
 
         result = empty_harness.validate()
         assert result.valid is False
-        assert any("maximum is 2" in e.lower() for e in result.errors)
+        assert "max_connections_exceeded" in result.error_codes
 
 
 class TestUnconnectedWarnings:
     """Tests for unconnected pin/core warnings."""
 
-    def test_unconnected_pins_warning(self, empty_harness, wire_red_20awg):
+    def test_unconnected_pins_warning(self, empty_harness, make_connector, wire_red_20awg):
         """Test that unconnected pins produce warnings."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=3,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=3,
-        )
+        x1 = make_connector(positions=3)
+        x2 = make_connector(positions=3)
         # Only connect pin 1, leave pins 2 and 3 unconnected
         empty_harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
 
         result = empty_harness.validate()
         assert result.valid is True  # Still valid, just has warnings
-        assert len(result.warnings) > 0
-        assert any("unconnected pins" in w.lower() for w in result.warnings)
+        assert "unconnected_pins" in result.warning_codes
+        assert "Connector X1 has unconnected pins: [2, 3]" in result.warnings
 
-    def test_unconnected_cable_cores_warning(self, empty_harness):
+    def test_unconnected_cable_cores_warning(self, empty_harness, connector_x1):
         """Test that unconnected cable cores produce warnings."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
         c1 = empty_harness.add_component(
             kind=ComponentType.CABLE,
             mpn="CABLE-1",
@@ -368,73 +257,70 @@ class TestUnconnectedWarnings:
             ],
         )
         # Only connect core 1, leave core 2 unconnected
-        empty_harness.connect(x1.pin(1), c1.core(1))
+        empty_harness.connect(connector_x1.pin(1), c1.core(1))
 
         result = empty_harness.validate()
         assert result.valid is True
-        assert any("unconnected cores" in w.lower() for w in result.warnings)
+        assert "unconnected_cores" in result.warning_codes
 
-    def test_fully_connected_no_warnings(self, empty_harness, wire_red_20awg, wire_black_20awg):
-        """Test that fully connected harness has no unconnected warnings."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
+    def test_unconnected_cores_with_duplicate_designators(self, empty_harness):
+        """Test that cables sharing a designator each report their own unconnected cores."""
+        empty_harness.add_component(
+            kind=ComponentType.CABLE,
+            mpn="CABLE-3",
             manufacturer="Test",
-            positions=2,
+            cores=[CableCore(n, awg=18, color=WireColor.RED) for n in (1, 2, 3)],
         )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
+        c2 = empty_harness.add_component(
+            kind=ComponentType.CABLE,
+            mpn="CABLE-1",
             manufacturer="Test",
-            positions=2,
+            cores=[CableCore(1, awg=18, color=WireColor.RED)],
         )
-        empty_harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
-        empty_harness.connect(x1.pin(2), x2.pin(2), wire=wire_black_20awg)
+        c2.designator = "C1"  # Bypass the generator to get a duplicate
 
         result = empty_harness.validate()
+        assert "duplicate_designator" in result.error_codes
+        assert "Cable C1 has unconnected cores: [1, 2, 3]" in result.warnings
+        assert "Cable C1 has unconnected cores: [1]" in result.warnings
+
+    def test_fully_connected_no_warnings(
+        self, harness_with_two_connectors, wire_red_20awg, wire_black_20awg
+    ):
+        """Test that fully connected harness has no unconnected warnings."""
+        harness, x1, x2 = harness_with_two_connectors
+        harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
+        harness.connect(x1.pin(2), x2.pin(2), wire=wire_black_20awg)
+
+        result = harness.validate()
         assert result.valid is True
         # Should have no "unconnected" warnings
-        unconnected_warnings = [w for w in result.warnings if "unconnected" in w.lower()]
-        assert len(unconnected_warnings) == 0
+        assert not result.warning_codes & {"unconnected_pins", "unconnected_cores"}
 
 
 class TestMultiplePinUsageWarning:
     """Tests for multiple pin usage warnings."""
 
-    def test_pin_used_twice_warning(self, empty_harness, wire_red_20awg, wire_black_20awg):
+    def test_pin_used_twice_warning(
+        self, harness_with_two_connectors, make_connector, wire_red_20awg, wire_black_20awg
+    ):
         """Test that using same pin twice produces a warning."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-        x2 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-2",
-            manufacturer="Test",
-            positions=2,
-        )
-        x3 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-3",
-            manufacturer="Test",
-            positions=2,
-        )
+        harness, x1, x2 = harness_with_two_connectors
+        x3 = make_connector()
 
         # Connect x1.pin(1) to two different destinations
-        empty_harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
-        empty_harness.connect(x1.pin(1), x3.pin(1), wire=wire_black_20awg)
+        harness.connect(x1.pin(1), x2.pin(1), wire=wire_red_20awg)
+        harness.connect(x1.pin(1), x3.pin(1), wire=wire_black_20awg)
 
-        result = empty_harness.validate()
+        result = harness.validate()
         assert result.valid is True  # Valid but with warning
-        assert any("multiple connections" in w.lower() for w in result.warnings)
+        assert "multiple_pin_connections" in result.warning_codes
 
 
 class TestComplexHarnessValidation:
     """Tests for complex harness validation scenarios."""
 
-    def test_complete_valid_harness(self, empty_harness):
+    def test_complete_valid_harness(self, empty_harness, wire_catalog):
         """Test a complete, valid harness passes validation."""
         # Add power supply
         ps1 = empty_harness.add_component(
@@ -461,8 +347,8 @@ class TestComplexHarnessValidation:
         )
 
         # Wires
-        wire_red = Wire(mpn="18AWG-RED", manufacturer="Generic", awg=18, color=WireColor.RED)
-        wire_black = Wire(mpn="18AWG-BLK", manufacturer="Generic", awg=18, color=WireColor.BLACK)
+        wire_red = wire_catalog["red18"]
+        wire_black = wire_catalog["black18"]
 
         # Connections
         empty_harness.connect(ps1.pin(1), cb1.pin(1), wire=wire_red, length_mm=200)
@@ -472,18 +358,11 @@ class TestComplexHarnessValidation:
         result = empty_harness.validate()
         assert result.valid is True
 
-    def test_harness_with_flying_leads(self, empty_harness, wire_red_20awg):
+    def test_harness_with_flying_leads(
+        self, empty_harness, connector_x1, flying_lead_tinned, wire_red_20awg
+    ):
         """Test harness with flying leads passes validation."""
-        x1 = empty_harness.add_component(
-            kind=ComponentType.CONNECTOR,
-            mpn="CONN-1",
-            manufacturer="Test",
-            positions=2,
-        )
-
-        flying_lead = FlyingLead(termination_type=FlyingLeadType.TINNED)
-
-        empty_harness.connect(x1.pin(1), flying_lead, wire=wire_red_20awg)
+        empty_harness.connect(connector_x1.pin(1), flying_lead_tinned, wire=wire_red_20awg)
 
         result = empty_harness.validate()
         assert result.valid is True